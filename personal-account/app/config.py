@@ -22,7 +22,16 @@ class settings:
         # ПУБЛИЧНЯ ЧАСТЬ БУДЕТ ПОТОМ :)
         self.API_PUBLIC_URL: str = os.getenv("API_PUBLIC_URL", "http://localhost:8004")
 
+        # CORS (comma-separated origins; preflight responses are cached by the browser for CORS_MAX_AGE seconds)
+        self.CORS_ALLOW_ORIGINS: list[str] = [
+            origin.strip()
+            for origin in os.getenv("CORS_ALLOW_ORIGINS", "http://localhost").split(",")
+            if origin.strip()
+        ]
+        self.CORS_MAX_AGE: int = int(os.getenv("CORS_MAX_AGE", "86400"))
+
         # Observability / OpenTelemetry - Core
+        self.OTEL_SDK_DISABLED: bool = os.getenv("OTEL_SDK_DISABLED", "false").lower() == "true"
         self.OTEL_EXPORTER_OTLP_ENDPOINT: str = os.getenv(
             "OTEL_EXPORTER_OTLP_ENDPOINT",
             "http://otel-collector:4317",
@@ -43,17 +52,20 @@ class settings:
         self.OTEL_ATTRIBUTE_VALUE_LENGTH_LIMIT: str = os.getenv("OTEL_ATTRIBUTE_VALUE_LENGTH_LIMIT", "4096")
 
         # OpenTelemetry - Export Configuration
-        self.OTEL_EXPORTER_OTLP_TIMEOUT: str = os.getenv("OTEL_EXPORTER_OTLP_TIMEOUT", "30000")  # ms
-        self.OTEL_BSP_MAX_EXPORT_BATCH_SIZE: str = os.getenv("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "512")
-        self.OTEL_BSP_SCHEDULE_DELAY: str = os.getenv("OTEL_BSP_SCHEDULE_DELAY", "5000")  # ms
-        self.OTEL_BSP_MAX_QUEUE_SIZE: str = os.getenv("OTEL_BSP_MAX_QUEUE_SIZE", "2048")
+        self.OTEL_EXPORTER_OTLP_TIMEOUT: str = os.getenv("OTEL_EXPORTER_OTLP_TIMEOUT", "10000")  # ms
+        self.OTEL_BSP_MAX_EXPORT_BATCH_SIZE: str = os.getenv("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "256")
+        self.OTEL_BSP_SCHEDULE_DELAY: str = os.getenv("OTEL_BSP_SCHEDULE_DELAY", "1000")  # ms
+        self.OTEL_BSP_MAX_QUEUE_SIZE: str = os.getenv("OTEL_BSP_MAX_QUEUE_SIZE", "4096")
 
         # OpenTelemetry - Feature Flags
         self.OTEL_ENABLE_CONSOLE_EXPORTER: bool = os.getenv("OTEL_ENABLE_CONSOLE_EXPORTER", "false").lower() == "true"
-        self.OTEL_ENABLE_LOGGING: bool = os.getenv("OTEL_ENABLE_LOGGING", "true").lower() == "true"
+        self.OTEL_ENABLE_LOGGING: bool = os.getenv("OTEL_ENABLE_LOGGING", "false").lower() == "true"
         self.OTEL_ENABLE_SQLALCHEMY: bool = os.getenv("OTEL_ENABLE_SQLALCHEMY", "true").lower() == "true"
         self.OTEL_ENABLE_HTTPX: bool = os.getenv("OTEL_ENABLE_HTTPX", "true").lower() == "true"
-        self.OTEL_EXCLUDED_URLS: str = os.getenv("OTEL_EXCLUDED_URLS", "/health,/metrics")
+        self.OTEL_EXCLUDED_URLS: str = os.getenv(
+            "OTEL_EXCLUDED_URLS",
+            "/health,/metrics,/static,/docs-swagger,/docs/oauth2-redirect,/openapi.json,/redoc",
+        )
 
         # Service metadata
         self.SERVICE_VERSION: str = os.getenv("SERVICE_VERSION", "1.0.0")
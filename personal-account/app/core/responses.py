@@ -0,0 +1,15 @@
+"""JSON response class used by default for API endpoints."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+from app.serialization import json_dumps
+
+
+class FallbackORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that falls back to stdlib json for content orjson rejects (see json_dumps)."""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
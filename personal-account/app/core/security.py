@@ -1,6 +1,7 @@
 """JWT security and token validation."""
 
 import logging
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -50,6 +51,11 @@ class TokenPayload(BaseModel):
 # replace internal jwks/cache with shared service
 _jwt_service = JwtService(keycloak_url=settings.KEYCLOAK_SERVER_URL, realm=settings.KEYCLOAK_REALM)
 
+# Short-lived cache of already validated tokens: the same token arrives with
+# every request of a page/dashboard burst, and signature checks are not free.
+_TOKEN_CACHE_TTL = 5  # seconds
+_TOKEN_CACHE_MAX_SIZE = 10_000
+
 
 class JWTValidator:
     """Validate JWT tokens using Keycloak JWKS."""
@@ -57,8 +63,29 @@ class JWTValidator:
     def __init__(self, keycloak_url: str, realm: str, client_id: str):
         self.client_id = client_id
         self.issuer = f"{keycloak_url.rstrip('/')}/realms/{realm}"
-
-    @traced("jwt_validator.validate_token", record_args=True, record_result=True)
+        self._token_cache: dict[str, tuple[float, TokenPayload]] = {}
+
+    def _get_cached(self, token: str) -> TokenPayload | None:
+        cached = self._token_cache.get(token)
+        if cached is None:
+            return None
+        expires_at, payload = cached
+        if expires_at <= time.monotonic():
+            self._token_cache.pop(token, None)
+            return None
+        return payload
+
+    def _cache(self, token: str, payload: TokenPayload) -> None:
+        # Never keep a token past its own expiration
+        ttl = min(_TOKEN_CACHE_TTL, payload.exp - time.time())
+        if ttl <= 0:
+            return
+        if len(self._token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            self._token_cache.pop(next(iter(self._token_cache)), None)
+        self._token_cache[token] = (time.monotonic() + ttl, payload)
+
+    @traced("jwt_validator.validate_token", record_args=False, record_result=False)
     async def validate_token(self, token: str) -> TokenPayload:
         """
         Validate JWT token and extract payload.
@@ -72,6 +99,10 @@ class JWTValidator:
         Raises:
             HTTPException: If token is invalid or expired
         """
+        cached = self._get_cached(token)
+        if cached is not None:
+            return cached
+
         try:
             payload = await _jwt_service.decode(token, audience="account", issuer=self.issuer)
             # extract roles as before
@@ -88,6 +119,7 @@ class JWTValidator:
                 payload["roles"] = list(roles)
             # Преобразуем в типизированный объект
             token_payload = TokenPayload(**payload)
+            self._cache(token, token_payload)
 
             logger.info(f"Token validated successfully for user {token_payload.sub}")
             return token_payload
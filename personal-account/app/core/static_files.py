@@ -0,0 +1,70 @@
+"""Static files with long-lived caching and an in-memory copy of small assets."""
+
+import logging
+import os
+import re
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+logger = logging.getLogger(__name__)
+
+# Content-hashed build artifacts (e.g. app.3f9a1c2b.js) never change under the same name
+_HASHED_ASSET = re.compile(r"\.[0-9a-f]{8,}\.(?:js|css|woff2)$")
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that serves preloaded small files from memory.
+
+    Files are loaded once by preload() (called on startup), so later edits on
+    disk are not picked up until restart. Everything else falls back to the
+    regular StaticFiles lookup.
+    """
+
+    def __init__(self, *args, max_cached_size: int = 64 * 1024, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_cached_size = max_cached_size
+        self._memcache: dict[str, tuple[bytes, Headers]] = {}
+
+    def preload(self) -> None:
+        """Read every file up to max_cached_size into memory."""
+        if self.directory is None:
+            return
+
+        directory = os.path.realpath(self.directory)
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                full_path = os.path.join(root, name)
+                # Same containment check as lookup_path: never cache what a request could not reach
+                resolved = os.path.abspath(full_path) if self.follow_symlink else os.path.realpath(full_path)
+                if os.path.commonpath([resolved, directory]) != directory:
+                    continue
+                stat_result = os.stat(full_path)
+                if stat_result.st_size > self.max_cached_size:
+                    continue
+                content = Path(full_path).read_bytes()
+                # Same content-type/etag/last-modified headers a FileResponse would send
+                headers = FileResponse(full_path, stat_result=stat_result).headers
+                path = os.path.normpath(os.path.relpath(full_path, self.directory))
+                self._memcache[path] = (content, headers)
+
+        logger.info("Preloaded %d static files into memory", len(self._memcache))
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        cached = self._memcache.get(path)
+        if cached is not None and scope["method"] in ("GET", "HEAD"):
+            content, headers = cached
+            if self.is_not_modified(headers, Headers(scope=scope)):
+                response = NotModifiedResponse(headers)
+            else:
+                response = Response(content if scope["method"] == "GET" else b"", headers=dict(headers))
+        else:
+            response = await super().get_response(path, scope)
+
+        if _HASHED_ASSET.search(path):
+            response.headers["cache-control"] = _IMMUTABLE_CACHE_CONTROL
+        return response
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator, Mapping
@@ -15,6 +15,7 @@ from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
 from app.config import get_settings
+from app.serialization import json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +53,24 @@ async def init_db_pool() -> None:
     logger.info("SQLAlchemy async engine initialized")
 
 
+async def warm_db_pool(timeout: float = 5.0) -> None:
+    """Open pool_size connections up front so the first requests skip the connect handshake.
+
+    Gives up after ``timeout`` seconds (TimeoutError) so an unreachable
+    database host cannot hold up startup for asyncpg's 60 s connect timeout.
+    """
+    if _engine is None:
+        raise RuntimeError("Database engine is not initialized")
+
+    async def _ping() -> None:
+        async with _engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Connections are held concurrently, so each ping opens a new one; all go back to the pool
+    await asyncio.wait_for(asyncio.gather(*(_ping() for _ in range(_engine.pool.size()))), timeout=timeout)
+    logger.info("SQLAlchemy pool warmed with %d connections", _engine.pool.size())
+
+
 async def close_db_pool() -> None:
     """Dispose SQLAlchemy engine."""
     global _engine
@@ -170,7 +189,7 @@ def _safe_serialize_params(params: Mapping[str, Any]) -> str:
     try:
         # Limit to first 10 params
         preview = {k: _safe_value(v) for i, (k, v) in enumerate(params.items()) if i < 10}
-        s = json.dumps(preview, default=str)
+        s = json_dumps(preview, default=str).decode()
         return s[:_MAX_ATTR_LEN] + ("..." if len(s) > _MAX_ATTR_LEN else "")
     except Exception:
         return "<unserializable>"
@@ -48,11 +48,15 @@ STUDENT_EMAIL_EXISTS = """
     """
 
 # Certificate queries -------------------------------------------------------
+# certificate_number is allocated by its SERIAL sequence inside the INSERT.
+# Selecting from student_s folds the "student exists" check into the same
+# statement: nothing is inserted (and nothing returned) for unknown students.
 CERTIFICATE_INSERT = """
     INSERT INTO personal_account.certificate_b
         (content, student_id, course_id, test_attempt_id)
-    VALUES
-        (:content, :student_id, :course_id, :test_attempt_id)
+    SELECT :content, s.id, :course_id, :test_attempt_id
+    FROM personal_account.student_s s
+    WHERE s.id = :student_id
     RETURNING *
     """
 
@@ -77,10 +81,13 @@ CERTIFICATES_FILTERED_TEMPLATE = """
 CERTIFICATE_BY_NUMBER = "SELECT * FROM personal_account.certificate_b WHERE certificate_number = :certificate_number"
 
 # Visit queries -------------------------------------------------------------
+# Returns nothing when the student is unknown or the visit is already recorded.
 VISIT_INSERT = """
     INSERT INTO personal_account.visit_students_for_lessons
         (student_id, lesson_id)
-    VALUES (:student_id, :lesson_id)
+    SELECT s.id, :lesson_id
+    FROM personal_account.student_s s
+    WHERE s.id = :student_id
     ON CONFLICT (student_id, lesson_id) DO NOTHING
     RETURNING *
     """
@@ -94,10 +101,4 @@ VISIT_FILTERED_TEMPLATE = """
     {where_clause}
     """
 
-VISIT_EXISTS = """
-    SELECT 1 FROM personal_account.visit_students_for_lessons
-    WHERE student_id = :student_id AND lesson_id = :lesson_id
-    LIMIT 1
-    """
-
 VISIT_BY_ID = "SELECT * FROM personal_account.visit_students_for_lessons WHERE id = :id"
@@ -6,10 +6,35 @@ from typing import Any, Iterable, Mapping
 from uuid import UUID
 
 from app.database import execute, fetch_all, fetch_one
-from app.db import queries as q
+from app.db.queries import (
+    BASE_COUNT,
+    BASE_DELETE,
+    BASE_EXISTS,
+    BASE_SELECT_ALL,
+    BASE_SELECT_BY_ID,
+)
 from app.telemetry import traced
 
 
+def build_filtered_queries(template: str, first_column: str, second_column: str) -> dict[tuple[bool, bool], str]:
+    """Render ``template`` for every combination of two optional equality filters.
+
+    Keys are ``(first_given, second_given)``; each variant is formatted once so
+    every call reuses the same SQL text.
+    """
+    queries: dict[tuple[bool, bool], str] = {}
+    for first_given in (True, False):
+        for second_given in (True, False):
+            conditions = [
+                f"{column} = :{column}"
+                for column, given in ((first_column, first_given), (second_column, second_given))
+                if given
+            ]
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            queries[first_given, second_given] = template.format(where_clause=where_clause)
+    return queries
+
+
 class base_repository:
     """Base repository class with common database operations."""
 
@@ -31,46 +56,47 @@ class base_repository:
         if self.default_order_by.lower() not in self.orderable_columns:
             self.orderable_columns.add(self.default_order_by.lower())
         self._table_identifier = self.full_table_name
+        # Fixed-shape statements are rendered once per repository, not per call
+        self._select_by_id_query = BASE_SELECT_BY_ID.format(table=self._table_identifier)
+        self._delete_query = BASE_DELETE.format(table=self._table_identifier)
+        self._exists_query = BASE_EXISTS.format(table=self._table_identifier)
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_by_id(self, entity_id: UUID) -> dict[str, Any] | None:
         """Get entity by ID."""
-        query = q.BASE_SELECT_BY_ID.format(table=self._table_identifier)
-        return await fetch_one(query, {"id": entity_id})
+        return await fetch_one(self._select_by_id_query, {"id": entity_id})
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_all(
         self, limit: int = 100, offset: int = 0, order_by: str | None = None, order_dir: str = "DESC"
     ) -> list[dict[str, Any]]:
         """Get all entities with pagination."""
         order_column = self._resolve_order_column(order_by)
         order_direction = self._resolve_order_direction(order_dir)
-        query = q.BASE_SELECT_ALL.format(
+        query = BASE_SELECT_ALL.format(
             table=self._table_identifier,
             order_clause=f"{order_column} {order_direction}",
         )
         return await fetch_all(query, {"limit": limit, "offset": offset})
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def count(self, where_clause: str = "", params: Mapping[str, Any] | None = None) -> int:
         """Count entities."""
         clause = f"WHERE {where_clause}" if where_clause else ""
-        query = q.BASE_COUNT.format(table=self._table_identifier, where_clause=clause)
+        query = BASE_COUNT.format(table=self._table_identifier, where_clause=clause)
         result = await fetch_one(query, params or {})
         return result["count"] if result else 0
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def delete(self, entity_id: UUID) -> bool:
-        """Delete entity by ID."""
-        query = q.BASE_DELETE.format(table=self._table_identifier)
-        affected = await execute(query, {"id": entity_id})
+        """Delete entity by ID, returns False if no row matched (no exists() check needed first)."""
+        affected = await execute(self._delete_query, {"id": entity_id})
         return affected > 0
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def exists(self, entity_id: UUID) -> bool:
         """Check if entity exists."""
-        query = q.BASE_EXISTS.format(table=self._table_identifier)
-        result = await fetch_one(query, {"id": entity_id})
+        result = await fetch_one(self._exists_query, {"id": entity_id})
         return result is not None
 
     def _resolve_order_column(self, order_by: str | None) -> str:
@@ -4,10 +4,18 @@ from typing import Any
 from uuid import UUID
 
 from app.database import execute_returning, fetch_all, fetch_one
-from app.db import queries as q
-from app.repositories.base import base_repository
+from app.db.queries import (
+    CERTIFICATE_BY_NUMBER,
+    CERTIFICATE_INSERT,
+    CERTIFICATES_BY_COURSE,
+    CERTIFICATES_BY_STUDENT,
+    CERTIFICATES_FILTERED_TEMPLATE,
+)
+from app.repositories.base import base_repository, build_filtered_queries
 from app.telemetry import traced
 
+_FILTERED_QUERIES = build_filtered_queries(CERTIFICATES_FILTERED_TEMPLATE, "student_id", "course_id")
+
 
 class certificate_repository(base_repository):
     """Repository for certificate operations."""
@@ -24,40 +32,36 @@ class certificate_repository(base_repository):
             "course_id": data["course_id"],
             "test_attempt_id": data.get("test_attempt_id"),
         }
-        return await execute_returning(q.CERTIFICATE_INSERT, params)
+        return await execute_returning(CERTIFICATE_INSERT, params)
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_by_student(self, student_id: UUID) -> list[dict[str, Any]]:
         """Get all certificates for a student."""
-        return await fetch_all(q.CERTIFICATES_BY_STUDENT, {"student_id": student_id})
+        return await fetch_all(CERTIFICATES_BY_STUDENT, {"student_id": student_id})
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_by_course(self, course_id: UUID) -> list[dict[str, Any]]:
         """Get all certificates for a course."""
-        return await fetch_all(q.CERTIFICATES_BY_COURSE, {"course_id": course_id})
+        return await fetch_all(CERTIFICATES_BY_COURSE, {"course_id": course_id})
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_filtered(self, student_id: UUID | None = None, course_id: UUID | None = None) -> list[dict[str, Any]]:
         """Get certificates with optional filters."""
-        conditions = []
         params: dict[str, Any] = {}
 
         if student_id:
-            conditions.append("student_id = :student_id")
             params["student_id"] = student_id
 
         if course_id:
-            conditions.append("course_id = :course_id")
             params["course_id"] = course_id
 
-        where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
-        query = q.CERTIFICATES_FILTERED_TEMPLATE.format(where_clause=where_clause)
-        return await fetch_all(query, params or {})
+        query = _FILTERED_QUERIES[bool(student_id), bool(course_id)]
+        return await fetch_all(query, params)
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_by_number(self, certificate_number: int) -> dict[str, Any] | None:
         """Get certificate by its unique number."""
-        return await fetch_one(q.CERTIFICATE_BY_NUMBER, {"certificate_number": certificate_number})
+        return await fetch_one(CERTIFICATE_BY_NUMBER, {"certificate_number": certificate_number})
 
 
 # Singleton instance
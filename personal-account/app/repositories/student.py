@@ -1,14 +1,25 @@
 """Student repository."""
 
-import json
+import asyncio
 from typing import Any
 from uuid import UUID
 
 from app.database import execute_returning, fetch_all, fetch_one
-from app.db import queries as q
+from app.db.queries import (
+    STUDENT_BY_EMAIL,
+    STUDENT_COUNT,
+    STUDENT_EMAIL_EXISTS,
+    STUDENT_INSERT,
+    STUDENT_PAGINATED,
+    STUDENT_UPDATE_TEMPLATE,
+)
 from app.repositories.base import base_repository
+from app.serialization import json_dumps
 from app.telemetry import traced
 
+_EMAIL_EXISTS_QUERY = STUDENT_EMAIL_EXISTS.format(exclude_clause="")
+_EMAIL_EXISTS_EXCLUDING_QUERY = STUDENT_EMAIL_EXISTS.format(exclude_clause="AND id != :exclude_id")
+
 
 class student_repository(base_repository):
     """Repository for student operations."""
@@ -25,7 +36,7 @@ class student_repository(base_repository):
     @traced()
     async def create(self, data: dict[str, Any]) -> dict[str, Any] | None:
         """Create a new student."""
-        contacts_json = json.dumps(data.get("contacts") or {})
+        contacts_json = json_dumps(data.get("contacts") or {}).decode()
 
         params = {
             "name": data["name"],
@@ -36,7 +47,7 @@ class student_repository(base_repository):
             "email": data["email"],
             "phone": data.get("phone"),
         }
-        return await execute_returning(q.STUDENT_INSERT, params)
+        return await execute_returning(STUDENT_INSERT, params)
 
     @traced()
     async def update(self, student_id: UUID, data: dict[str, Any]) -> dict[str, Any] | None:
@@ -55,7 +66,7 @@ class student_repository(base_repository):
             if key not in self._mutable_fields:
                 continue
             if key == "contacts":
-                params[key] = json.dumps(value)
+                params[key] = json_dumps(value).decode()
                 set_clauses.append(f"{key} = CAST(:{key} AS jsonb)")
             else:
                 params[key] = value
@@ -65,38 +76,37 @@ class student_repository(base_repository):
             return await self.get_by_id(student_id)
 
         set_clauses.append("updated_at = CURRENT_TIMESTAMP")
-        query = q.STUDENT_UPDATE_TEMPLATE.format(set_clause=", ".join(set_clauses))
+        query = STUDENT_UPDATE_TEMPLATE.format(set_clause=", ".join(set_clauses))
         return await execute_returning(query, params)
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_by_email(self, email: str) -> dict[str, Any] | None:
         """Get student by email."""
-        return await fetch_one(q.STUDENT_BY_EMAIL, {"email": email})
+        return await fetch_one(STUDENT_BY_EMAIL, {"email": email})
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_paginated(self, page: int = 1, limit: int = 20) -> tuple[list[dict[str, Any]], int]:
         """Get paginated list of students."""
         offset = (page - 1) * limit
 
-        # Get total count
-        count_result = await fetch_one(q.STUDENT_COUNT, {})
+        # Count and page queries are independent, run them on two pooled connections at once
+        count_result, students = await asyncio.gather(
+            fetch_one(STUDENT_COUNT, {}),
+            fetch_all(STUDENT_PAGINATED, {"limit": limit, "offset": offset}),
+        )
         total = count_result["count"] if count_result else 0
 
-        # Get paginated data
-        students = await fetch_all(q.STUDENT_PAGINATED, {"limit": limit, "offset": offset})
-
         return students, total
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def email_exists(self, email: str, exclude_id: UUID | None = None) -> bool:
         """Check if email already exists."""
         if exclude_id:
-            exclude_clause = "AND id != :exclude_id"
+            query = _EMAIL_EXISTS_EXCLUDING_QUERY
             params = {"email": email, "exclude_id": exclude_id}
         else:
-            exclude_clause = ""
+            query = _EMAIL_EXISTS_QUERY
             params = {"email": email}
-        query = q.STUDENT_EMAIL_EXISTS.format(exclude_clause=exclude_clause)
         result = await fetch_one(query, params)
         return result is not None
 
@@ -18,7 +18,7 @@ router = APIRouter(prefix="/certificates", tags=["Certificates"])
     summary="Получить список сертификатов",
     description="Возвращает список сертификатов с опциональной фильтрацией по студенту и курсу",
 )
-@traced("router.certificates.get_certificates")
+@traced("router.certificates.get_certificates", record_args=False, record_result=False)
 async def get_certificates(
     student_id: UUID | None = Query(default=None, description="Фильтр по студенту"),
     course_id: UUID | None = Query(default=None, description="Фильтр по курсу"),
@@ -34,7 +34,7 @@ async def get_certificates(
     summary="Получить сертификат по ID",
     description="Возвращает данные сертификата по указанному ID",
 )
-@traced("router.certificates.get_certificate")
+@traced("router.certificates.get_certificate", record_args=False, record_result=False)
 async def get_certificate(certificate_id: UUID, current_user: TokenPayload = Depends(get_current_user)):
     """Get certificate by ID."""
     return await certificate_service.get_certificate(certificate_id)
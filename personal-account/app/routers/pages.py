@@ -1,6 +1,7 @@
 """Frontend pages router with Jinja2 templates."""
 
 import logging
+from functools import lru_cache
 
 from fastapi import APIRouter, Request
 from fastapi.responses import (
@@ -29,19 +30,9 @@ def _render_template_safe(template_name: str, context: dict):
     in logs and traces.
     """
     try:
-        # TemplateResponse will be returned to FastAPI and rendered by Starlette
-        resp = templates.TemplateResponse(template_name, context)
-        # Add trace headers to response (best-effort)
-        try:
-            span = trace.get_current_span()
-            span_ctx = span.get_span_context()
-            if span_ctx and span_ctx.is_valid:
-                resp.headers["X-Trace-Id"] = format(span_ctx.trace_id, "032x")
-                resp.headers["X-Span-Id"] = format(span_ctx.span_id, "016x")
-        except Exception:
-            # Don't fail rendering if tracing helpers fail
-            logger.debug("Failed to attach trace headers to template response")
-        return resp
+        # TemplateResponse will be returned to FastAPI and rendered by Starlette.
+        # Trace headers are added by TraceHeadersMiddleware like for any other response.
+        return templates.TemplateResponse(template_name, context)
     except Exception as exc:
         # Attach exception to current span and log with trace identifiers
         span = trace.get_current_span()
@@ -69,8 +60,13 @@ def _render_template_safe(template_name: str, context: dict):
         raise
 
 
+@lru_cache()
 def get_keycloak_urls() -> dict:
-    """Generate Keycloak URLs for templates."""
+    """Generate Keycloak URLs for templates.
+
+    The URLs depend only on settings, so they are built once and reused;
+    callers unpack the result into a fresh template context.
+    """
     base_url = settings.KEYCLOAK_PUBLIC_URL
     realm = settings.KEYCLOAK_REALM
     client_id = settings.KEYCLOAK_CLIENT_ID
@@ -19,7 +19,7 @@ router = APIRouter(prefix="/students", tags=["Students"])
     summary="Получить список студентов",
     description="Возвращает пагинированный список всех студентов",
 )
-@traced("router.students.get_students")
+@traced("router.students.get_students", record_args=False, record_result=False)
 async def get_students(
     page: int = Query(default=1, ge=1, description="Номер страницы"),
     limit: int = Query(default=20, ge=1, le=100, description="Количество элементов на странице"),
@@ -35,7 +35,7 @@ async def get_students(
     summary="Получить студента по ID",
     description="Возвращает данные студента по указанному ID",
 )
-@traced("router.students.get_student")
+@traced("router.students.get_student", record_args=False, record_result=False)
 async def get_student(student_id: UUID, current_user: TokenPayload = Depends(get_current_user)):
     """Get student by ID."""
     return await student_service.get_student(student_id)
@@ -18,7 +18,7 @@ router = APIRouter(prefix="/visits", tags=["Visits"])
     summary="Получить список посещений уроков",
     description="Возвращает список посещений с опциональной фильтрацией по студенту и уроку",
 )
-@traced("router.visits.get_visits", record_args=True, record_result=True)
+@traced("router.visits.get_visits", record_args=False, record_result=False)
 async def get_visits(
     student_id: UUID | None = Query(default=None, description="Фильтр по студенту"),
     lesson_id: UUID | None = Query(default=None, description="Фильтр по уроку"),
@@ -34,7 +34,7 @@ async def get_visits(
     summary="Получить посещение по ID",
     description="Возвращает данные посещения по указанному ID",
 )
-@traced("router.visits.get_visit", record_args=True, record_result=True)
+@traced("router.visits.get_visit", record_args=False, record_result=False)
 async def get_visit(visit_id: UUID, current_user: TokenPayload = Depends(get_current_user)):
     """Get visit by ID."""
     return await visit_service.get_visit(visit_id)
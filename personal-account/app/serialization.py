@@ -0,0 +1,20 @@
+"""JSON serialization shared by the API, the database layer and telemetry."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+
+def json_dumps(value: Any, *, default: Callable[[Any], Any] | None = None, option: int | None = None) -> bytes:
+    """Serialize ``value`` with orjson, falling back to stdlib json where orjson refuses.
+
+    orjson raises TypeError for integers beyond 64 bits, which free-form data
+    (student contacts) may legitimately hold; stdlib json encodes them exactly.
+    The fallback keeps orjson's compact, non-ASCII-escaped output.
+    """
+    try:
+        return orjson.dumps(value, default=default, option=option)
+    except TypeError:
+        return json.dumps(value, default=default, ensure_ascii=False, separators=(",", ":")).encode()
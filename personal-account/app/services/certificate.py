@@ -4,7 +4,6 @@ from uuid import UUID
 
 from app.exceptions import not_found_error
 from app.repositories.certificate import certificate_repository
-from app.repositories.student import student_repository
 from app.schemas.certificate import certificate_create, certificate_response
 from app.telemetry import traced
 
@@ -14,9 +13,8 @@ class certificate_service:
 
     def __init__(self):
         self.repository = certificate_repository
-        self.student_repository = student_repository
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_certificates(
         self, student_id: UUID | None = None, course_id: UUID | None = None
     ) -> list[certificate_response]:
@@ -24,7 +22,7 @@ class certificate_service:
         certificates = await self.repository.get_filtered(student_id, course_id)
         return [certificate_response(**c) for c in certificates]
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_certificate(self, certificate_id: UUID) -> certificate_response:
         """Get certificate by ID."""
         certificate = await self.repository.get_by_id(certificate_id)
@@ -37,27 +35,25 @@ class certificate_service:
     @traced()
     async def create_certificate(self, data: certificate_create) -> certificate_response:
         """Create a new certificate."""
-        # Verify student exists
-        if not await self.student_repository.exists(data.student_id):
-            raise not_found_error("Student", str(data.student_id))
-
         # Note: Course validation would require cross-schema query
         # In production, you'd validate course_id exists in knowledge_base.course_b
 
+        # The insert only succeeds for an existing student, so an empty result
+        # means the student is missing (see CERTIFICATE_INSERT).
         certificate = await self.repository.create(data.model_dump())
 
         if not certificate:
-            raise Exception("Failed to create certificate")
+            raise not_found_error("Student", str(data.student_id))
 
         return certificate_response(**certificate)
 
     @traced()
     async def delete_certificate(self, certificate_id: UUID) -> bool:
         """Delete certificate by ID."""
-        if not await self.repository.exists(certificate_id):
+        if not await self.repository.delete(certificate_id):
             raise not_found_error("Certificate", str(certificate_id))
 
-        return await self.repository.delete(certificate_id)
+        return True
 
 
 # Singleton instance
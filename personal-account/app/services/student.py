@@ -15,14 +15,14 @@ class student_service:
     def __init__(self):
         self.repository = student_repository
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_students(self, page: int = 1, limit: int = 20) -> paginated_response[student_response]:
         """Get paginated list of students."""
         students, total = await self.repository.get_paginated(page, limit)
 
         return paginated_response(data=[student_response(**s) for s in students], total=total, page=page, limit=limit)
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_student(self, student_id: UUID) -> student_response:
         """Get student by ID."""
         student = await self.repository.get_by_id(student_id)
@@ -54,11 +54,20 @@ class student_service:
         if not existing:
             raise not_found_error("Student", str(student_id))
 
+        # Only send fields that actually differ, an unchanged payload skips the UPDATE entirely
+        changes = {
+            key: value
+            for key, value in data.model_dump(exclude_unset=True).items()
+            if value is not None and existing.get(key) != value
+        }
+        if not changes:
+            return student_response(**existing)
+
         # Check for email conflict if email is being updated
-        if data.email and await self.repository.email_exists(data.email, student_id):
-            raise conflict_error(f"Email '{data.email}' is already in use")
+        if "email" in changes and await self.repository.email_exists(changes["email"], student_id):
+            raise conflict_error(f"Email '{changes['email']}' is already in use")
 
-        student = await self.repository.update(student_id, data.model_dump(exclude_unset=True))
+        student = await self.repository.update(student_id, changes)
 
         if not student:
             raise Exception("Failed to update student")
@@ -68,10 +77,10 @@ class student_service:
     @traced()
     async def delete_student(self, student_id: UUID) -> bool:
         """Delete student by ID."""
-        if not await self.repository.exists(student_id):
+        if not await self.repository.delete(student_id):
             raise not_found_error("Student", str(student_id))
 
-        return await self.repository.delete(student_id)
+        return True
 
 
 # Singleton instance
@@ -16,13 +16,13 @@ class visit_service:
         self.repository = visit_repository
         self.student_repository = student_repository
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_visits(self, student_id: UUID | None = None, lesson_id: UUID | None = None) -> list[visit_response]:
         """Get visits with optional filters."""
         visits = await self.repository.get_filtered(student_id, lesson_id)
         return [visit_response(**v) for v in visits]
 
-    @traced()
+    @traced(record_args=False, record_result=False)
     async def get_visit(self, visit_id: UUID) -> visit_response:
         """Get visit by ID."""
         visit = await self.repository.get_by_id(visit_id)
@@ -35,32 +35,27 @@ class visit_service:
     @traced()
     async def create_visit(self, data: visit_create) -> visit_response:
         """Create a new visit record."""
-        # Verify student exists
-        if not await self.student_repository.exists(data.student_id):
-            raise not_found_error("Student", str(data.student_id))
-
         # Note: Lesson validation would require cross-schema query
         # In production, you'd validate lesson_id exists in knowledge_base.lesson_d
 
-        # Check for duplicate visit
-        if await self.repository.visit_exists(data.student_id, data.lesson_id):
-            raise conflict_error("Visit record already exists for this student and lesson")
-
+        # Student check and duplicate handling happen inside the insert (see VISIT_INSERT),
+        # the failure reason is only looked up when nothing was inserted.
         visit = await self.repository.create(data.model_dump())
 
         if not visit:
-            # This shouldn't happen due to ON CONFLICT DO NOTHING
-            raise conflict_error("Visit record already exists")
+            if not await self.student_repository.exists(data.student_id):
+                raise not_found_error("Student", str(data.student_id))
+            raise conflict_error("Visit record already exists for this student and lesson")
 
         return visit_response(**visit)
 
     @traced()
     async def delete_visit(self, visit_id: UUID) -> bool:
         """Delete visit by ID."""
-        if not await self.repository.exists(visit_id):
+        if not await self.repository.delete(visit_id):
             raise not_found_error("Visit", str(visit_id))
 
-        return await self.repository.delete(visit_id)
+        return True
 
 
 # Singleton instance
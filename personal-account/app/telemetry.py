@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import inspect
-import json
 import logging
 from functools import wraps
 from typing import Any, Callable, ParamSpec, TypeVar
 
+import orjson
 from opentelemetry import trace
 from opentelemetry.trace import StatusCode
 
+from app.serialization import json_dumps
+
 P = ParamSpec("P")
 T = TypeVar("T")
 
@@ -21,6 +23,11 @@ _logger = logging.getLogger(__name__)
 _MAX_ATTR_LEN = 1024
 
 
+def _dumps(value: Any) -> str:
+    """Serialize a preview to JSON; UUID/datetime are handled natively by orjson."""
+    return json_dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def _safe_serialize(value: Any, max_len: int = _MAX_ATTR_LEN) -> str:
     """Safely serialize a value to string for span attributes."""
     try:
@@ -29,18 +36,18 @@ def _safe_serialize(value: Any, max_len: int = _MAX_ATTR_LEN) -> str:
         if isinstance(value, (str, int, float, bool)):
             s = str(value)
         elif isinstance(value, (list, tuple)):
-            s = json.dumps(value[:10], default=str)  # limit list preview
+            s = _dumps(value[:10])  # limit list preview
         elif isinstance(value, dict):
             # Limit dict preview to first 10 keys
             preview = {k: v for i, (k, v) in enumerate(value.items()) if i < 10}
-            s = json.dumps(preview, default=str)
+            s = _dumps(preview)
         elif hasattr(value, "__dict__"):
             # Pydantic models or dataclasses
             d = getattr(value, "model_dump", getattr(value, "dict", lambda: value.__dict__))
             if callable(d):
                 d = d()
             preview = {k: v for i, (k, v) in enumerate(d.items()) if i < 10}
-            s = json.dumps(preview, default=str)
+            s = _dumps(preview)
         else:
             s = repr(value)
         return s[:max_len] + ("..." if len(s) > max_len else "")
@@ -12,6 +12,7 @@ import logging
 from typing import Optional
 
 from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.grpc.exporter import Compression
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
@@ -33,7 +34,7 @@ from opentelemetry.sdk.trace.export import (
 from opentelemetry.sdk.trace.sampling import (
     ALWAYS_OFF,
     ALWAYS_ON,
-    ParentBasedTraceIdRatio,
+    ParentBased,
     TraceIdRatioBased,
 )
 
@@ -56,14 +57,18 @@ class TelemetryConfig:
     MAX_ATTRIBUTE_LENGTH = int(settings.OTEL_ATTRIBUTE_VALUE_LENGTH_LIMIT or "4096")
 
     # Export configuration
-    EXPORT_TIMEOUT_MILLIS = int(settings.OTEL_EXPORTER_OTLP_TIMEOUT or "30000")  # 30s
-    EXPORT_MAX_BATCH_SIZE = int(settings.OTEL_BSP_MAX_EXPORT_BATCH_SIZE or "512")
-    EXPORT_SCHEDULE_DELAY_MILLIS = int(settings.OTEL_BSP_SCHEDULE_DELAY or "5000")  # 5s
-    EXPORT_MAX_QUEUE_SIZE = int(settings.OTEL_BSP_MAX_QUEUE_SIZE or "2048")
+    # Bounds each gRPC export call, so it is also how long a hung collector can block the batch worker
+    EXPORT_TIMEOUT_MILLIS = int(settings.OTEL_EXPORTER_OTLP_TIMEOUT or "10000")  # 10s
+    # Batch processor: small frequent batches
+    EXPORT_MAX_BATCH_SIZE = int(settings.OTEL_BSP_MAX_EXPORT_BATCH_SIZE or "256")
+    EXPORT_SCHEDULE_DELAY_MILLIS = int(settings.OTEL_BSP_SCHEDULE_DELAY or "1000")  # 1s
+    EXPORT_MAX_QUEUE_SIZE = int(settings.OTEL_BSP_MAX_QUEUE_SIZE or "4096")
 
     # Feature flags
     ENABLE_CONSOLE_EXPORTER = settings.OTEL_ENABLE_CONSOLE_EXPORTER or False
-    ENABLE_LOGGING_INSTRUMENTATION = settings.OTEL_ENABLE_LOGGING or True
+    # Off by default: LoggingInstrumentor patches record creation for every log call,
+    # TraceContextFormatter already adds trace ids to the records that get emitted
+    ENABLE_LOGGING_INSTRUMENTATION = settings.OTEL_ENABLE_LOGGING
     ENABLE_SQLALCHEMY_INSTRUMENTATION = settings.OTEL_ENABLE_SQLALCHEMY or True
     ENABLE_HTTPX_INSTRUMENTATION = settings.OTEL_ENABLE_HTTPX or True
 
@@ -71,16 +76,17 @@ class TelemetryConfig:
     def get_sampler():
         """Get configured sampler based on sampling rate.
 
-        Uses ParentBasedTraceIdRatio:
-        - If parent span is sampled, child is sampled
-        - Otherwise, uses probability-based sampling
+        Always parent-based, including at 0% and 100%:
+        - If a parent span exists, its sampled flag is followed
+        - Otherwise (root spans), the sampling rate decides
         """
         if TelemetryConfig.SAMPLING_RATE >= 1.0:
-            return ALWAYS_ON
+            root = ALWAYS_ON
         elif TelemetryConfig.SAMPLING_RATE <= 0.0:
-            return ALWAYS_OFF
+            root = ALWAYS_OFF
         else:
-            return ParentBasedTraceIdRatio(TelemetryConfig.SAMPLING_RATE)
+            root = TraceIdRatioBased(TelemetryConfig.SAMPLING_RATE)
+        return ParentBased(root=root)
 
     @staticmethod
     def get_span_limits():
@@ -114,6 +120,7 @@ class TelemetryConfig:
             endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT,
             insecure=settings.OTEL_EXPORTER_OTLP_INSECURE,
             timeout=TelemetryConfig.EXPORT_TIMEOUT_MILLIS // 1000,  # Convert to seconds
+            compression=Compression.Gzip,
         )
 
     @staticmethod
@@ -133,6 +140,12 @@ def configure_telemetry() -> None:
 
     This should be called once at application startup.
     """
+    if settings.OTEL_SDK_DISABLED:
+        # Don't build the exporter at all: no gRPC channel, no batch worker thread
+        trace.set_tracer_provider(trace.NoOpTracerProvider())
+        logger.info("OpenTelemetry SDK disabled (OTEL_SDK_DISABLED=true)")
+        return
+
     try:
         # Create resource
         resource = TelemetryConfig.get_resource()
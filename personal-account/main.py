@@ -1,17 +1,25 @@
 """Personal Account API - Education Platform."""
 
 import logging
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+import asyncpg
+import orjson
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import Response
 from opentelemetry import trace
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.routing import Route
 
 from app.config import get_settings
-from app.database import close_db_pool, init_db_pool
+from app.core.middleware import TraceHeadersMiddleware
+from app.core.responses import FallbackORJSONResponse
+from app.core.static_files import CachedStaticFiles
+from app.database import close_db_pool, init_db_pool, warm_db_pool
 from app.exceptions import app_exception
 from app.routers import auth, certificates, health, pages, students, visits
 from app.telemetry_config import (
@@ -27,12 +35,33 @@ from app.telemetry_config import (
 class TraceContextFormatter(logging.Formatter):
     """Formatter that safely handles missing OTEL trace context."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted asctime); one tuple so concurrent threads never see a mismatched pair
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record, datefmt=None):
+        # datefmt has one-second resolution, so localtime/strftime only run when the second changes
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second == cached_second:
+            return cached_text
+        text = super().formatTime(record, datefmt)
+        self._cached_time = (second, text)
+        return text
+
     def format(self, record):
-        # Add trace_id and span_id if not present (for logs outside trace context)
-        if not hasattr(record, "otelTraceID"):
-            record.otelTraceID = "0" * 32
-        if not hasattr(record, "otelSpanID"):
-            record.otelSpanID = "0" * 16
+        # Without LoggingInstrumentor (off by default) read the active span here,
+        # so only records that are actually emitted pay for the lookup
+        if not hasattr(record, "otelTraceID") or not hasattr(record, "otelSpanID"):
+            span_context = trace.get_current_span().get_span_context()
+            if span_context.is_valid:
+                record.otelTraceID = format(span_context.trace_id, "032x")
+                record.otelSpanID = format(span_context.span_id, "016x")
+            else:
+                # Logs outside trace context
+                record.otelTraceID = "0" * 32
+                record.otelSpanID = "0" * 16
 
         # Use the shorter names for compatibility
         record.trace_id = getattr(record, "otelTraceID", "0" * 32)
@@ -50,6 +79,11 @@ handler.setFormatter(
     )
 )
 
+# Thread/process names are not in the log format, don't collect them for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 logging.basicConfig(level=logging.INFO, handlers=[handler])
 logger = logging.getLogger(__name__)
 
@@ -75,6 +109,17 @@ async def lifespan(app: FastAPI):
     await init_db_pool()
     logger.info("Database pool initialized")
 
+    # Pre-open pooled connections; an unavailable DB must not block startup (see /health/db)
+    try:
+        await warm_db_pool()
+    except TimeoutError:
+        logger.warning("Database pool warm-up timed out, continuing startup")
+    except (OSError, asyncpg.PostgresError, SQLAlchemyError) as exc:
+        # Connect failures surface unwrapped: OSError (refused/DNS) or asyncpg errors (auth, unknown database)
+        logger.warning("Failed to warm database pool: %s", exc)
+
+    static_files.preload()
+
     yield
 
     # Shutdown
@@ -97,6 +142,17 @@ oauth2_scheme = {
     },
 }
 
+# Static parts of the OpenAPI document, built once at import
+_SECURITY_SCHEMES = {
+    "OAuth2PasswordBearer": oauth2_scheme,
+    "BearerAuth": {
+        "type": "http",
+        "scheme": "bearer",
+        "bearerFormat": "JWT",
+        "description": "Введите JWT access_token (без префикса 'Bearer')",
+    },
+}
+
 app = FastAPI(
     title="Personal Account API",
     description="""
@@ -119,6 +175,7 @@ API для личного кабинета системы онлайн обра
     """,
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FallbackORJSONResponse,
     root_path="/account",  # Базовый путь приложения за nginx
     docs_url="/docs-swagger",
     redoc_url="/redoc",
@@ -149,15 +206,7 @@ def custom_openapi():
             "description": "Personal Account API (behind nginx proxy)",
         }
     ]
-    openapi_schema["components"]["securitySchemes"] = {
-        "OAuth2PasswordBearer": oauth2_scheme,
-        "BearerAuth": {
-            "type": "http",
-            "scheme": "bearer",
-            "bearerFormat": "JWT",
-            "description": "Введите JWT access_token (без префикса 'Bearer')",
-        },
-    }
+    openapi_schema["components"]["securitySchemes"] = _SECURITY_SCHEMES
     # Global security - endpoints can override
     openapi_schema["security"] = [{"OAuth2PasswordBearer": []}, {"BearerAuth": []}]
     app.openapi_schema = openapi_schema
@@ -166,27 +215,26 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
-# CORS middleware
+
+# Middleware stack. Every add_middleware call wraps the ones before it, so this reads innermost first:
+# trace headers (need the active server span) -> OpenTelemetry -> CORS -> GZip (outermost)
+app.add_middleware(TraceHeadersMiddleware)
+
+# Instrument FastAPI with telemetry
+instrument_fastapi(app)
+
+# CORS: preflights are answered here, outside instrumentation, so they never create spans
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify actual origins
+    allow_origins=settings.CORS_ALLOW_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
+    max_age=settings.CORS_MAX_AGE,
 )
 
-
-@app.middleware("http")
-async def add_trace_headers(request: Request, call_next):
-    response = await call_next(request)
-    span = trace.get_current_span()
-    span_context = span.get_span_context()
-    if span_context and span_context.is_valid:
-        trace_id = format(span_context.trace_id, "032x")
-        span_id = format(span_context.span_id, "016x")
-        response.headers["X-Trace-Id"] = trace_id
-        response.headers["X-Span-Id"] = span_id
-    return response
+# Response compression, outermost so it compresses the final output of everything above
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 @app.exception_handler(app_exception)
@@ -200,7 +248,15 @@ async def app_exception_handler(request: Request, exc: app_exception):
         span.set_attribute("error.type", "app_exception")
         span.set_attribute("error.status_code", exc.status_code)
 
-    return JSONResponse(status_code=exc.status_code, content={"error": exc.message})
+    return FallbackORJSONResponse(status_code=exc.status_code, content={"error": exc.message})
+
+
+# Full tracebacks logged per exception type per second; beyond that only a one-line error is logged
+_MAX_TRACEBACKS_PER_SECOND = 10
+_traceback_log_window: dict[str, tuple[int, int]] = {}
+
+# The 500 body never changes, so it is serialized once
+_INTERNAL_ERROR_BODY = orjson.dumps({"error": "Internal server error"})
 
 
 @app.exception_handler(Exception)
@@ -213,20 +269,48 @@ async def general_exception_handler(request: Request, exc: Exception):
         span.set_attribute("error", True)
         span.set_attribute("error.type", "unexpected_exception")
 
-    logger.exception(f"Unexpected error: {exc}")
-    return JSONResponse(status_code=500, content={"error": "Internal server error"})
+    # Formatting a traceback is expensive; during an error storm keep counting but skip it
+    error_type = type(exc).__name__
+    now = int(time.monotonic())
+    window, count = _traceback_log_window.get(error_type, (now, 0))
+    count = count + 1 if window == now else 1
+    _traceback_log_window[error_type] = (now, count)
+
+    if count <= _MAX_TRACEBACKS_PER_SECOND:
+        logger.exception("Unexpected error: %s", exc)
+    else:
+        logger.error("Unexpected error: %s (traceback suppressed, %s #%d this second)", exc, error_type, count)
+    return Response(content=_INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
 
 
 # Include routers
 app.include_router(pages.router)  # Frontend pages (no prefix)
 app.include_router(health.router)
-app.include_router(auth.router, prefix=settings.API_PREFIX)
-app.include_router(students.router, prefix=settings.API_PREFIX)
-app.include_router(certificates.router, prefix=settings.API_PREFIX)
-app.include_router(visits.router, prefix=settings.API_PREFIX)
-
-# Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
-
-# Instrument FastAPI with telemetry
-instrument_fastapi(app)
+# REST API routers share one prefix, so they are grouped and mounted once
+api_router = APIRouter(prefix=settings.API_PREFIX)
+api_router.include_router(auth.router)
+api_router.include_router(students.router)
+api_router.include_router(certificates.router)
+api_router.include_router(visits.router)
+app.include_router(api_router)
+
+# Mount static files (small files are preloaded into memory in lifespan)
+static_files = CachedStaticFiles(directory="static")
+app.mount("/static", static_files, name="static")
+
+# All routes are registered: build the OpenAPI schema once and serve the pre-serialized bytes
+_OPENAPI_JSON = orjson.dumps(app.openapi())
+
+
+async def openapi_json(request: Request) -> Response:  # noqa: RUF029 - async keeps it off the threadpool
+    return Response(content=_OPENAPI_JSON, media_type="application/json")
+
+
+# Swaps FastAPI's /openapi.json route for the cached one. Must stay the last statement,
+# after every include_router/mount: the schema above only covers routes registered before it.
+app.router.routes = [
+    Route(app.openapi_url, openapi_json, include_in_schema=False)
+    if isinstance(route, Route) and route.path == app.openapi_url
+    else route
+    for route in app.router.routes
+]
@@ -0,0 +1,60 @@
+"""Contacts are free-form JSON: values orjson cannot handle must not turn into a 500."""
+
+import asyncio
+import json
+
+from app import database
+from app.core.responses import FallbackORJSONResponse
+from app.repositories import student as student_module
+from app.serialization import json_dumps
+from app.telemetry import _safe_serialize
+
+# Valid JSON integer that does not fit into 64 bits
+BIG_INT = 123456789012345678901234567890
+
+
+def test_json_dumps_falls_back_for_big_integers():
+    assert json.loads(json_dumps({"id": BIG_INT, "name": "Иван"})) == {"id": BIG_INT, "name": "Иван"}
+
+
+def test_create_student_with_big_integer_contact(monkeypatch):
+    captured = {}
+
+    async def fake_execute_returning(query, params):
+        captured.update(params)
+        return params
+
+    monkeypatch.setattr(student_module, "execute_returning", fake_execute_returning)
+
+    data = {"name": "Ivan", "surname": "Ivanov", "email": "ivan@example.com", "contacts": {"id": BIG_INT}}
+    asyncio.run(student_module.student_repository.create(data))
+
+    assert json.loads(captured["contacts"]) == {"id": BIG_INT}
+
+
+def test_engine_keeps_stdlib_jsonb_decoding(monkeypatch):
+    # orjson.loads would silently turn BIG_INT into a float and reject 1e400, so no override is passed
+    engine_kwargs = {}
+    create_async_engine = database.create_async_engine
+
+    def capture_create_async_engine(url, **kwargs):
+        engine_kwargs.update(kwargs)
+        return create_async_engine(url, **kwargs)
+
+    monkeypatch.setattr(database, "create_async_engine", capture_create_async_engine)
+    asyncio.run(database.init_db_pool())
+    try:
+        assert engine_kwargs
+        assert "json_deserializer" not in engine_kwargs
+    finally:
+        asyncio.run(database.close_db_pool())
+
+
+def test_response_falls_back_for_big_integers():
+    response = FallbackORJSONResponse({"contacts": {"id": BIG_INT}})
+    assert json.loads(response.body) == {"contacts": {"id": BIG_INT}}
+
+
+def test_span_previews_keep_big_integers():
+    assert json.loads(_safe_serialize({"contacts": {"id": BIG_INT}})) == {"contacts": {"id": BIG_INT}}
+    assert json.loads(database._safe_serialize_params({"id": BIG_INT})) == {"id": BIG_INT}